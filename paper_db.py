@@ -3,25 +3,60 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import os
+import re
 import shutil
 import sqlite3
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Sequence, Set
+from types import ModuleType
+from typing import Dict, Iterator, List, Sequence
 
 DEFAULT_DB = Path(__file__).parent / "library" / "db" / "papers.db"
 DEFAULT_GRAPH_DIR = Path(__file__).parent / "library" / "graph"
+# Bump whenever init_db() gains DDL so existing databases re-run the bootstrap once.
+SCHEMA_VERSION = 10
+ABSTRACT_CHARS = 2000
+SUMMARY_CHARS = 500
 
 
 def connect(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode: writes are grouped explicitly with transaction() instead of the
+    # sqlite3 module's implicit per-DML transactions.
+    conn = sqlite3.connect(db_path, isolation_level=None)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    apply_pragmas(conn, db_path)
     return conn
 
 
+@contextmanager
+def transaction(conn: sqlite3.Connection, mode: str = "") -> Iterator[sqlite3.Connection]:
+    """Run the block in one explicit BEGIN [mode] ... COMMIT, rolling back on any exception."""
+    conn.execute(f"BEGIN {mode}".rstrip())
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def apply_pragmas(conn: sqlite3.Connection, db_path: Path | str) -> None:
+    # WAL + NORMAL sync: commits append to the log instead of fsyncing a rollback journal.
+    if str(db_path) != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-20000;")  # ~20 MiB
+
+
 def ensure_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
     existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
     for name, ddl in columns.items():
@@ -29,9 +64,19 @@ def ensure_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]
             conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
 
 
-def init_db(conn: sqlite3.Connection) -> None:
-    conn.executescript(
-        """
+def iter_statements(script: str) -> Iterator[str]:
+    """Split a SQL script into complete statements (trigger bodies included)."""
+    pending = ""
+    for line in script.splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            yield pending.strip()
+            pending = ""
+    if pending.strip():
+        yield pending.strip()
+
+
+SCHEMA_SQL = """
         CREATE TABLE IF NOT EXISTS projects (
             id TEXT PRIMARY KEY,
             name TEXT,
@@ -132,15 +177,36 @@ def init_db(conn: sqlite3.Connection) -> None:
         );
 
          CREATE INDEX IF NOT EXISTS idx_papers_title ON papers(title);
-         CREATE INDEX IF NOT EXISTS idx_relationships_source ON relationships(source_id);
          CREATE INDEX IF NOT EXISTS idx_relationships_target ON relationships(target_id);
          CREATE INDEX IF NOT EXISTS idx_risk_assessments_paper_id ON risk_assessments(paper_id);
          CREATE INDEX IF NOT EXISTS idx_inbox_status ON inbox(status);
          CREATE INDEX IF NOT EXISTS idx_notes_paper_id ON notes(paper_id);
+         CREATE INDEX IF NOT EXISTS idx_paper_notes_paper_id ON paper_notes(paper_id);
          """
-     )
 
 
+# auto_build_links' 'related-<category>' links are undirected and stored once as (min_id, max_id); read
+# them through this view to see both directions. Plain 'related' links are user-entered and keep their
+# direction. Older databases may already hold both rows, so only missing reverses are added.
+RELATIONSHIPS_BIDIR_SQL = """
+        CREATE VIEW relationships_bidir AS
+        SELECT id, source_id, target_id, relation_type, note, created_at, 0 AS reversed
+        FROM relationships
+        UNION ALL
+        SELECT r.id, r.target_id, r.source_id, r.relation_type, r.note, r.created_at, 1
+        FROM relationships r
+        WHERE r.relation_type LIKE 'related-%'
+          AND NOT EXISTS (
+              SELECT 1 FROM relationships x
+              WHERE x.source_id = r.target_id AND x.target_id = r.source_id AND x.relation_type = r.relation_type
+          )
+        """
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    for statement in iter_statements(SCHEMA_SQL):
+        conn.execute(statement)
+
     ensure_columns(
         conn,
         "papers",
@@ -186,76 +252,263 @@ def init_db(conn: sqlite3.Connection) -> None:
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_papers_project_id ON papers(project_id) WHERE project_id IS NOT NULL;"
     )
-    conn.commit()
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_papers_project_bibtex ON papers(project_id) WHERE bibtex IS NOT NULL;"
+    )
+    # UNIQUE(source_id, target_id, relation_type) already indexes source_id as its prefix and
+    # backs the INSERT OR IGNORE probes; a separate source index only added write cost.
+    conn.execute("DROP INDEX IF EXISTS idx_relationships_source;")
+    # Recreated on every schema bump so existing databases pick up definition changes.
+    conn.execute("DROP VIEW IF EXISTS relationships_bidir;")
+    conn.execute(RELATIONSHIPS_BIDIR_SQL)
+    ensure_fts(conn)
+    ensure_paper_tags(conn)
+
+
+FTS_SQL = """
+        CREATE VIRTUAL TABLE papers_fts USING fts5(
+            title, authors,
+            content='papers', content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+            INSERT INTO papers_fts(rowid, title, authors)
+            VALUES (new.id, new.title, new.authors);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+            INSERT INTO papers_fts(papers_fts, rowid, title, authors)
+            VALUES ('delete', old.id, old.title, old.authors);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS papers_fts_au AFTER UPDATE OF title, authors ON papers BEGIN
+            INSERT INTO papers_fts(papers_fts, rowid, title, authors)
+            VALUES ('delete', old.id, old.title, old.authors);
+            INSERT INTO papers_fts(rowid, title, authors)
+            VALUES (new.id, new.title, new.authors);
+        END;
+
+        INSERT INTO papers_fts(papers_fts) VALUES ('rebuild');
+        """
+
+
+def has_table(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    return has_table(conn, "papers_fts")
+
+
+def ensure_fts(conn: sqlite3.Connection) -> None:
+    """Create the papers_fts index (and sync triggers) once, backfilling existing rows."""
+    if has_fts(conn):
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(papers_fts)")}
+        if "tags" not in columns:
+            return
+        # Earlier layout also indexed tags/keywords, which searches never matched on.
+        for trigger in ("papers_fts_ai", "papers_fts_ad", "papers_fts_au"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute("DROP TABLE papers_fts")
+    try:
+        for statement in iter_statements(FTS_SQL):
+            conn.execute(statement)
+    except sqlite3.OperationalError as exc:  # pragma: no cover - depends on SQLite build
+        if "fts5" not in str(exc):
+            raise
+        print("SQLite lacks FTS5; list filters fall back to LIKE scans.", file=sys.stderr)
+
+
+# paper_tags kind -> comma-joined papers column it is derived from
+PAPER_TAG_COLUMNS = {"tag": "tags", "keyword": "keywords"}
+
+
+def ensure_paper_tags(conn: sqlite3.Connection) -> None:
+    """Create the indexed (paper, tag) table; triggers queue changed papers for sync_paper_tags()."""
+    if has_table(conn, "paper_tags_dirty"):
+        return
+    # Earlier layout split the CSV in trigger SQL (ASCII-only trim/NOCASE); rebuild it from scratch.
+    for trigger in ("paper_tags_ai", "paper_tags_au", "paper_tags_ad"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE IF EXISTS paper_tags")
+    conn.execute(
+        """
+        CREATE TABLE paper_tags (
+            paper_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (paper_id, kind, tag)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("CREATE INDEX idx_paper_tags_tag ON paper_tags(kind, tag)")
+    conn.execute("CREATE TABLE paper_tags_dirty (paper_id INTEGER PRIMARY KEY)")
+    # Plain SQL triggers so writes from the UI (better-sqlite3) are queued too; the split and
+    # Unicode lowercasing happen in Python, where they match normalize_tags() exactly.
+    queue = "INSERT OR IGNORE INTO paper_tags_dirty (paper_id) VALUES (new.id);"
+    conn.execute(f"CREATE TRIGGER paper_tags_ai AFTER INSERT ON papers BEGIN {queue} END")
+    conn.execute(f"CREATE TRIGGER paper_tags_au AFTER UPDATE OF tags, keywords ON papers BEGIN {queue} END")
+    conn.execute(
+        "CREATE TRIGGER paper_tags_ad AFTER DELETE ON papers BEGIN "
+        "DELETE FROM paper_tags WHERE paper_id = old.id; "
+        "DELETE FROM paper_tags_dirty WHERE paper_id = old.id; END"
+    )
+    conn.execute("INSERT INTO paper_tags_dirty (paper_id) SELECT id FROM papers")
+
+
+def tag_keys(value: str | None) -> set[str]:
+    """Lowercased tags of a stored column: the keys normalize_tags() dedupes on."""
+    return {part.lower() for part in split_csv(value)}
+
+
+def sync_paper_tags(conn: sqlite3.Connection) -> None:
+    """Re-derive paper_tags rows for papers queued by the triggers since the last sync."""
+    if conn.execute("SELECT 1 FROM paper_tags_dirty LIMIT 1").fetchone() is None:
+        return
+    columns = ", ".join(f"p.{column}" for column in PAPER_TAG_COLUMNS.values())
+    with transaction(conn, "IMMEDIATE"):
+        rows = conn.execute(
+            f"SELECT p.id, {columns} FROM paper_tags_dirty d JOIN papers p ON p.id = d.paper_id"
+        ).fetchall()
+        conn.execute("DELETE FROM paper_tags WHERE paper_id IN (SELECT paper_id FROM paper_tags_dirty)")
+        conn.executemany(
+            "INSERT INTO paper_tags (paper_id, kind, tag) VALUES (?, ?, ?)",
+            (
+                (row[0], kind, tag)
+                for row in rows
+                for kind, value in zip(PAPER_TAG_COLUMNS, row[1:])
+                for tag in tag_keys(value)
+            ),
+        )
+        conn.execute("DELETE FROM paper_tags_dirty")
+
+
+def init_db(conn: sqlite3.Connection) -> None:
+    # Already bootstrapped by this (or a newer) schema: skip the DDL and table_info scans.
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    # executescript() commits on entry, so run the DDL statement by statement inside a
+    # single IMMEDIATE transaction: a cold start costs one fsync instead of dozens.
+    with transaction(conn, "IMMEDIATE"):
+        _create_schema(conn)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
 
 def normalize_tags(raw_tags: Sequence[str] | None) -> List[str]:
-    tags: List[str] = []
     if not raw_tags:
-        return tags
+        return []
+    # Keyed by lowercase: dedupes case-insensitively while keeping first-seen order and spelling.
+    unique: Dict[str, str] = {}
     for tag in raw_tags:
-        parts = [p.strip() for p in tag.split(",")]
-        tags.extend([p for p in parts if p])
-    # Preserve order but remove duplicates
-    seen = set()
-    unique = []
-    for tag in tags:
-        if tag.lower() not in seen:
-            seen.add(tag.lower())
-            unique.append(tag)
-    return unique
+        for part in tag.split(","):
+            part = part.strip()
+            if part:
+                unique.setdefault(part.lower(), part)
+    return list(unique.values())
+
+
+def split_csv(value: str | None) -> List[str]:
+    """Split a stored comma-joined column without deduping; for display use stored_tags()."""
+    if not value:
+        return []
+    # str.split + map(str.strip) beats a regex split here; see split_authors().
+    return [part for part in map(str.strip, value.split(",")) if part]
+
+
+def stored_tags(value: str | None) -> List[str]:
+    """Tags/keywords of a stored row, deduped case-insensitively: the UI saves them as typed."""
+    return normalize_tags([value]) if value else []
 
 
 def split_authors(authors: str | None) -> List[str]:
     if not authors:
         return []
+    # Deliberately not a regex: replace() + split() are single C passes and measure ~2x faster
+    # than re.split(r" and |,").
     cleaned = authors.replace(" and ", ",")
     return [part.strip() for part in cleaned.split(",") if part.strip()]
 
 
-def has_overlap(a: List[str], b: List[str]) -> bool:
-    set_a = {x.lower() for x in a}
-    set_b = {x.lower() for x in b}
-    return bool(set_a & set_b)
+PDF_META_KEYS = ("title", "author", "subject", "keywords", "creator", "producer", "creation_date", "mod_date")
+# PyMuPDF metadata names for PDF_META_KEYS
+FITZ_META_KEYS = {
+    "title": "title",
+    "author": "author",
+    "subject": "subject",
+    "keywords": "keywords",
+    "creator": "creator",
+    "producer": "producer",
+    "creation_date": "creationDate",
+    "mod_date": "modDate",
+}
 
 
-def extract_pdf(pdf_path: Path) -> tuple[str, Dict[str, str]]:
+@lru_cache(maxsize=None)
+def pdf_backend() -> tuple[str, ModuleType]:
+    """Import the PDF library once: PyMuPDF when installed (much faster), else pypdf."""
+    try:
+        import fitz
+    except ImportError:
+        pass
+    else:
+        return "pymupdf", fitz
     try:
         import pypdf
     except ImportError as exc:  # pragma: no cover - depends on env
         raise SystemExit(
             "pypdf is required for PDF import. Install with 'pip install pypdf'."
         ) from exc
+    return "pypdf", pypdf
 
-    reader = pypdf.PdfReader(str(pdf_path))
-    text_parts = []
-    for page in reader.pages:
-        text_parts.append(page.extract_text() or "")
-    text = "\n".join(text_parts).strip()
 
+def extract_pdf(pdf_path: Path, max_chars: int | None = None) -> tuple[str, Dict[str, str]]:
+    """Extract text and metadata; pages past ``max_chars`` of buffered text are never parsed."""
+    backend, module = pdf_backend()
     meta: Dict[str, str] = {}
-    if reader.metadata:
-        md = reader.metadata
-        for key in ("title", "author", "subject", "keywords", "creator", "producer", "creation_date", "mod_date"):
-            val = getattr(md, key, None)
-            if val:
-                meta[key] = str(val)
-        # pypdf stores raw keys too
-        for k, v in md.items():
-            if v:
-                meta[str(k).lower()] = str(v)
-    return text, meta
+    if backend == "pymupdf":
+        doc = module.open(str(pdf_path))
+        raw_meta = doc.metadata or {}
+        for key, fitz_key in FITZ_META_KEYS.items():
+            if raw_meta.get(fitz_key):
+                meta[key] = str(raw_meta[fitz_key])
+        pages, page_text = doc, lambda page: page.get_text()
+    else:
+        doc = None
+        reader = module.PdfReader(str(pdf_path), strict=False)
+        if reader.metadata:
+            md = reader.metadata
+            for key in PDF_META_KEYS:
+                val = getattr(md, key, None)
+                if val:
+                    meta[key] = str(val)
+        pages, page_text = reader.pages, lambda page: page.extract_text() or ""
+
+    buf = io.StringIO()
+    try:
+        for index, page in enumerate(pages):
+            # Checked before extract_text(): content streams are only parsed for pages we keep.
+            if max_chars is not None and buf.tell() >= max_chars:
+                break
+            if index:
+                buf.write("\n")
+            buf.write(page_text(page))
+    finally:
+        if doc is not None:
+            doc.close()
+    return buf.getvalue().strip(), meta
+
+
+YEAR_RE = re.compile(r"[0-9]{4}")
 
 
 def guess_year_from_meta(meta: Dict[str, str]) -> int | None:
     for key in ("creation_date", "mod_date", "date"):
-        if key in meta and meta[key]:
-            digits = "".join(ch for ch in str(meta[key]) if ch.isdigit())
-            if len(digits) >= 4:
-                try:
-                    return int(digits[:4])
-                except ValueError:
-                    continue
+        match = YEAR_RE.search(str(meta.get(key) or ""))
+        if match:
+            return int(match.group())
     return None
 
 
@@ -272,24 +525,38 @@ def maybe_copy_pdf(src: Path, dest_dir: Path, do_copy: bool) -> Path:
     return dest
 
 
+# One round-trip; each branch is an index lookup and the rank keeps id > paper_id > DOI precedence.
+RESOLVE_PAPER_SQL = """
+    SELECT id FROM (
+        SELECT id, 0 AS rank FROM papers WHERE id = :id
+        UNION ALL
+        SELECT id, 1 AS rank FROM papers WHERE paper_id = :key
+        UNION ALL
+        SELECT id, 2 AS rank FROM papers WHERE doi = :key
+    )
+    ORDER BY rank
+    LIMIT 1
+"""
+
+
 def resolve_paper_id(conn: sqlite3.Connection, key: str) -> int:
-    cur = conn.cursor()
-    if key.isdigit():
-        row = cur.execute("SELECT id FROM papers WHERE id = ?", (int(key),)).fetchone()
-        if row:
-            return int(row[0])
-    for column in ("paper_id", "doi"):
-        row = cur.execute(f"SELECT id FROM papers WHERE {column} = ?", (key,)).fetchone()
-        if row:
-            return int(row[0])
+    numeric_id = int(key) if key.isdigit() else None
+    row = conn.execute(RESOLVE_PAPER_SQL, {"id": numeric_id, "key": key}).fetchone()
+    if row:
+        return int(row[0])
     raise SystemExit(f"Paper not found for key '{key}'. Use id, paper_id, or DOI.")
 
 
-def cmd_init(args: argparse.Namespace) -> None:
-    db_path = Path(args.db)
-    conn = connect(db_path)
+def open_db(args: argparse.Namespace) -> sqlite3.Connection:
+    """Shared command prelude; init_db() is a no-op once the schema version is current."""
+    conn = connect(Path(args.db))
     init_db(conn)
-    print(f"Initialized database at {db_path}")
+    return conn
+
+
+def cmd_init(args: argparse.Namespace) -> None:
+    open_db(args)
+    print(f"Initialized database at {Path(args.db)}")
 
 
 def insert_paper(
@@ -365,88 +632,143 @@ def insert_paper(
             "INSERT INTO notes (paper_id, content) VALUES (?, ?)",
             (paper_id, args.notes),
         )
-    conn.commit()
     print(f"Added paper #{paper_id}: {args.title}")
     return int(paper_id)
 
 
 def cmd_add(args: argparse.Namespace) -> None:
-    db_path = Path(args.db)
-    conn = connect(db_path)
-    init_db(conn)
+    conn = open_db(args)
     tags = normalize_tags(args.tag)
     keywords = normalize_tags(args.keywords)
 
-    insert_paper(conn, args, tags, keywords, file_path=args.file_path, fulltext=args.fulltext)
+    with transaction(conn):
+        insert_paper(conn, args, tags, keywords, file_path=args.file_path, fulltext=args.fulltext)
 
 
-def cmd_import_pdf(args: argparse.Namespace) -> None:
-    pdf_path = Path(args.path)
-    if not pdf_path.is_file():
-        raise SystemExit(f"PDF not found: {pdf_path}")
+# import-pdf options that identify a single paper and so cannot be shared by a batch
+PER_PAPER_OPTIONS = ("paper_id", "doi", "title", "abstract", "summary", "notes", "url", "bibtex", "fulltext")
 
-    db_path = Path(args.db)
-    conn = connect(db_path)
-    init_db(conn)
 
-    text, meta = extract_pdf(pdf_path)
-    title = args.title or meta.get("title") or pdf_path.stem
-    authors = args.authors or meta.get("author")
-    year = args.year or guess_year_from_meta(meta)
+def pdf_paper_args(
+    args: argparse.Namespace, pdf_path: Path, text: str, meta: Dict[str, str]
+) -> argparse.Namespace:
+    """Per-PDF copy of the CLI args with metadata/text-derived defaults filled in."""
+    paper = argparse.Namespace(**vars(args))
+    paper.title = args.title or meta.get("title") or pdf_path.stem
+    paper.authors = args.authors or meta.get("author")
+    paper.year = args.year or guess_year_from_meta(meta)
 
-    keywords = normalize_tags(args.keywords)
-    if not keywords and meta.get("keywords"):
-        keywords = normalize_tags([meta["keywords"]])
-    tags = normalize_tags(args.tag)
+    paper.keywords = normalize_tags(args.keywords)
+    if not paper.keywords and meta.get("keywords"):
+        paper.keywords = normalize_tags([meta["keywords"]])
+    paper.tag = normalize_tags(args.tag)
 
-    abstract = args.abstract
-    if not abstract and text:
-        abstract = text.split("\n\n", 1)[0].strip()[:2000]
-    summary = args.summary
-    if not summary and text:
-        summary = text.strip()[:500]
+    paper.abstract = args.abstract
+    if not paper.abstract and text:
+        paper.abstract = text.split("\n\n", 1)[0].strip()[:ABSTRACT_CHARS]
+    paper.summary = args.summary
+    if not paper.summary and text:
+        paper.summary = text.strip()[:SUMMARY_CHARS]
 
-    file_path = maybe_copy_pdf(pdf_path, Path(args.copy_dir), args.copy)
-    fulltext = None if args.skip_fulltext else (args.fulltext or text)
+    paper.fulltext = None if args.skip_fulltext else (args.fulltext or text)
+    return paper
 
-    args.title = title
-    args.authors = authors
-    args.year = year
-    args.abstract = abstract
-    args.summary = summary
-    args.file_path = str(file_path)
-    args.fulltext = fulltext
 
-    insert_paper(conn, args, tags, keywords, file_path=str(file_path), fulltext=fulltext)
+def cmd_import_pdf(args: argparse.Namespace) -> None:
+    pdf_paths = [Path(p) for p in args.path]
+    for pdf_path in pdf_paths:
+        if not pdf_path.is_file():
+            raise SystemExit(f"PDF not found: {pdf_path}")
+    if len(pdf_paths) > 1:
+        per_paper = [f"--{name.replace('_', '-')}" for name in PER_PAPER_OPTIONS if getattr(args, name)]
+        if per_paper:
+            raise SystemExit(f"{', '.join(per_paper)} can only be used when importing a single PDF")
+
+    conn = open_db(args)
+
+    # Unless the extracted text is stored, only the abstract/summary prefixes are needed,
+    # and with both supplied on the command line only the metadata is read.
+    if not args.skip_fulltext and not args.fulltext:
+        max_chars = None
+    elif args.abstract and args.summary:
+        max_chars = 0
+    else:
+        max_chars = ABSTRACT_CHARS
+
+    # Extraction is CPU-bound and independent per PDF; fan it out, keep writes on this connection.
+    if len(pdf_paths) == 1:
+        extracted = [extract_pdf(pdf_paths[0], max_chars=max_chars)]
+    else:
+        # Imported here: concurrent.futures.process drags in multiprocessing and logging, which
+        # would otherwise add ~50ms to every CLI call and every tool importing this module.
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(pdf_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            extracted = list(pool.map(extract_pdf, pdf_paths, repeat(max_chars)))
+
+    # Copy and insert together: an interrupted import leaves neither rows nor stray copies.
+    copied: List[Path] = []
+    try:
+        with transaction(conn):
+            for pdf_path, (text, meta) in zip(pdf_paths, extracted):
+                paper = pdf_paper_args(args, pdf_path, text, meta)
+                file_path = maybe_copy_pdf(pdf_path, Path(args.copy_dir), args.copy)
+                if args.copy:
+                    copied.append(file_path)
+                paper.file_path = str(file_path)
+                insert_paper(conn, paper, paper.tag, paper.keywords, file_path=paper.file_path, fulltext=paper.fulltext)
+    except BaseException:
+        for file_path in copied:
+            file_path.unlink(missing_ok=True)
+        raise
+
+
+def fts_term(value: str) -> str:
+    """Quote each word of a user term as an FTS5 token-prefix query, ANDed together."""
+    tokens = [tok.replace('"', '""') for tok in value.split()]
+    return " AND ".join(f'"{tok}"*' for tok in tokens if tok.strip('"'))
+
+
+LIST_COLUMNS = (
+    "id", "paper_id", "project_id", "title", "year", "venue", "doi", "database", "revrieved_sought",
+    "sought_not_revrieved", "evaluation", "is_duplicated", "duplicate_reason", "is_excluded", "excluded_reason",
+    "is_included", "included_reason", "keywords", "tags", "relevance", "dataset_used", "methods", "file_path",
+    "bibtex",
+)
 
 
 def cmd_list(args: argparse.Namespace) -> None:
-    db_path = Path(args.db)
-    conn = connect(db_path)
-    init_db(conn)
+    conn = open_db(args)
 
     clauses = []
     params: List[object] = []
-    if args.search:
-        clauses.append("(title LIKE ? OR authors LIKE ?)")
+    match = fts_term(args.search) if args.search and has_fts(conn) else ""
+    if match:
+        clauses.append("papers_fts MATCH ?")
+        params.append(match)
+    elif args.search:
+        clauses.append("(p.title LIKE ? OR p.authors LIKE ?)")
         like = f"%{args.search}%"
         params.extend([like, like])
-    if args.tag:
-        clauses.append("tags LIKE ?")
-        params.append(f"%{args.tag}%")
-    if args.keyword:
-        clauses.append("keywords LIKE ?")
-        params.append(f"%{args.keyword}%")
-
-    sql = "SELECT id, paper_id, project_id, title, year, venue, doi, database, revrieved_sought, sought_not_revrieved, evaluation, is_duplicated, duplicate_reason, is_excluded, excluded_reason, is_included, included_reason, keywords, tags, relevance, dataset_used, methods, file_path, bibtex FROM papers"
+    # Exact (case-insensitive) tag/keyword matches served by idx_paper_tags_tag.
+    if args.tag or args.keyword:
+        sync_paper_tags(conn)
+    for kind, value in (("tag", args.tag), ("keyword", args.keyword)):
+        if value:
+            clauses.append("p.id IN (SELECT paper_id FROM paper_tags WHERE kind = ? AND tag = ?)")
+            params.extend([kind, value.strip().lower()])
+
+    sql = "SELECT " + ", ".join(f"p.{c}" for c in LIST_COLUMNS) + " FROM papers p"
+    if match:
+        sql += " JOIN papers_fts ON papers_fts.rowid = p.id"
     if clauses:
         sql += " WHERE " + " AND ".join(clauses)
-    sql += " ORDER BY added_at DESC"
+    sql += " ORDER BY bm25(papers_fts), p.added_at DESC" if match else " ORDER BY p.added_at DESC"
     if args.limit:
         sql += " LIMIT ?"
         params.append(args.limit)
 
-
     cur = conn.execute(sql, params)
     rows = cur.fetchall()
     if not rows:
@@ -499,168 +821,180 @@ def cmd_list(args: argparse.Namespace) -> None:
             print("     BibTeX: (stored)")
 
 
-def cmd_link(args: argparse.Namespace) -> None:
-    db_path = Path(args.db)
-    conn = connect(db_path)
-    init_db(conn)
-
-    source_id = resolve_paper_id(conn, args.source)
-    target_id = resolve_paper_id(conn, args.target)
-
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT OR IGNORE INTO relationships (source_id, target_id, relation_type, note)
-        VALUES (?, ?, ?, ?)
-        """,
-        (source_id, target_id, args.type, args.note),
-    )
-    conn.commit()
+def link(
+    source: str,
+    target: str,
+    relation_type: str = "related",
+    note: str | None = None,
+    db: str | Path | None = None,
+) -> None:
+    """Link two papers (id/DOI/paper_id) without going through the CLI."""
+    conn = connect(Path(db) if db else DEFAULT_DB)
+    try:
+        init_db(conn)
+        source_id = resolve_paper_id(conn, source)
+        target_id = resolve_paper_id(conn, target)
+
+        with transaction(conn):
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO relationships (source_id, target_id, relation_type, note)
+                VALUES (?, ?, ?, ?)
+                """,
+                (source_id, target_id, relation_type, note),
+            )
+    finally:
+        conn.close()
 
     if cur.rowcount == 0:
         print("Relationship already exists; nothing changed.")
     else:
         print(
-            f"Linked {source_id} -> {target_id} as '{args.type}'"
-            + (f" (note: {args.note})" if args.note else "")
+            f"Linked {source_id} -> {target_id} as '{relation_type}'"
+            + (f" (note: {note})" if note else "")
         )
 
 
+def cmd_link(args: argparse.Namespace) -> None:
+    link(args.source, args.target, args.type, args.note, args.db)
+
+
+def delete_project(conn: sqlite3.Connection, project_id: str) -> int:
+    """Delete a project and its papers in one transaction; returns the number of papers removed."""
+    with transaction(conn):
+        # Relationships, risk assessments and notes follow their papers via ON DELETE CASCADE.
+        removed = conn.execute("DELETE FROM papers WHERE project_id = ?", (project_id,)).rowcount
+        if conn.execute("DELETE FROM projects WHERE id = ?", (project_id,)).rowcount == 0:
+            raise SystemExit(f"Project not found: {project_id}")
+    return removed
+
+
+def cmd_delete_project(args: argparse.Namespace) -> None:
+    conn = open_db(args)
+    removed = delete_project(conn, args.project_id)
+    print(f"Deleted project {args.project_id} and {removed} paper(s)")
+
+
+GRAPH_NODE_COLUMNS = (
+    "id", "paper_id", "project_id", "title", "abstract", "keywords", "year", "venue", "authors", "doi", "url",
+    "database", "revrieved_sought", "sought_not_revrieved", "evaluation", "is_duplicated", "duplicate_reason",
+    "is_excluded", "excluded_reason", "is_included", "included_reason", "tags", "relevance", "dataset_used",
+    "methods", "metrics", "limitations", "future_work", "summary", "extra", "bibtex", "file_path",
+)
+
+
 def rows_to_graph(
     conn: sqlite3.Connection, project_id: str | None = None
 ) -> Dict[str, List[Dict[str, object]]]:
-    papers = conn.execute(
-        """
-        SELECT id, paper_id, project_id, title, abstract, keywords, year, venue, authors, doi, url, database,
-               revrieved_sought, sought_not_revrieved, evaluation,
-               is_duplicated, duplicate_reason, is_excluded, excluded_reason, is_included, included_reason, tags, relevance,
-               dataset_used, methods, metrics, limitations, future_work, summary, extra, bibtex, file_path
+    # Plain tuples on this hot path: sqlite3.Row pays a name lookup for every field access.
+    cur = conn.cursor()
+    cur.row_factory = None
+    papers = cur.execute(
+        f"""
+        SELECT {", ".join(GRAPH_NODE_COLUMNS)}
         FROM papers
         WHERE (:project_id IS NULL OR project_id = :project_id)
         ORDER BY id
         """,
         {"project_id": project_id},
     ).fetchall()
-    links = conn.execute(
-        "SELECT source_id, target_id, relation_type, note FROM relationships"
+    # Filter edges in SQL so links outside the project never cross into Python.
+    links = cur.execute(
+        """
+        SELECT r.source_id, r.target_id, r.relation_type, r.note
+        FROM relationships_bidir r
+        JOIN papers ps ON ps.id = r.source_id
+        JOIN papers pt ON pt.id = r.target_id
+        WHERE (:project_id IS NULL OR (ps.project_id = :project_id AND pt.project_id = :project_id))
+        ORDER BY r.id, r.reversed
+        """,
+        {"project_id": project_id},
     ).fetchall()
 
-    node_ids: Set[int] = {int(p["id"]) for p in papers}
-
+    tags_idx = GRAPH_NODE_COLUMNS.index("tags")
+    keywords_idx = GRAPH_NODE_COLUMNS.index("keywords")
     nodes = []
-    for p in papers:
-        tags = normalize_tags([p["tags"]] if p["tags"] else None)
-        keywords = normalize_tags([p["keywords"]] if p["keywords"] else None)
-        nodes.append(
-            {
-                "id": p["id"],
-                "paper_id": p["paper_id"],
-                "project_id": p["project_id"],
-                "title": p["title"],
-                "abstract": p["abstract"],
-                "keywords": keywords,
-                "year": p["year"],
-                "venue": p["venue"],
-                "authors": p["authors"],
-                "doi": p["doi"],
-                "url": p["url"],
-                "database": p["database"],
-                "revrieved_sought": p["revrieved_sought"],
-                "sought_not_revrieved": p["sought_not_revrieved"],
-                "evaluation": p["evaluation"],
-                "is_duplicated": p["is_duplicated"],
-                "duplicate_reason": p["duplicate_reason"],
-                "is_excluded": p["is_excluded"],
-                "excluded_reason": p["excluded_reason"],
-                "is_included": p["is_included"],
-                "included_reason": p["included_reason"],
-                "tags": tags,
-                "relevance": p["relevance"],
-                "dataset_used": p["dataset_used"],
-                "methods": p["methods"],
-                "metrics": p["metrics"],
-                "limitations": p["limitations"],
-                "future_work": p["future_work"],
-                "summary": p["summary"],
-                "extra": p["extra"],
-                "bibtex": p["bibtex"],
-                "file_path": p["file_path"],
-            }
-        )
+    for row in papers:
+        node = dict(zip(GRAPH_NODE_COLUMNS, row))
+        node["tags"] = stored_tags(row[tags_idx])
+        node["keywords"] = stored_tags(row[keywords_idx])
+        nodes.append(node)
 
-    edges = []
-    for l in links:
-        if project_id and (l["source_id"] not in node_ids or l["target_id"] not in node_ids):
-            continue
-        edges.append(
-            {
-                "source": l["source_id"],
-                "target": l["target_id"],
-                "type": l["relation_type"],
-                "note": l["note"],
-            }
-        )
+    edges = [
+        {"source": source, "target": target, "type": relation_type, "note": note}
+        for source, target, relation_type, note in links
+    ]
 
     return {"nodes": nodes, "links": edges}
 
 
+# Indexed by (overlap_tag << 2) | (overlap_kw << 1) | overlap_auth; None keeps the base type.
+EDGE_TYPE_BY_MASK = (
+    None,
+    "related-author",
+    "related-keyword",
+    "related-keyword-author",
+    "related-tag",
+    "related-tag-author",
+    "related-tag-keyword",
+    "related-tag-keyword-author",
+)
+
+
+def lower_set(values: Sequence[str] | None) -> frozenset[str]:
+    return frozenset(v.lower() for v in values) if values else frozenset()
+
 
-def resolve_edge_type(edge: Dict[str, object], nodes_by_id: Dict[int, Dict[str, object]]) -> str:
+def resolve_edge_type(
+    edge: Dict[str, object],
+    tags_lc: Dict[int, frozenset[str]],
+    kw_lc: Dict[int, frozenset[str]],
+    auth_lc: Dict[int, frozenset[str]],
+) -> str:
     base = str(edge.get("type", "related"))
     if base != "related":
         return base
 
-    src = nodes_by_id.get(int(edge["source"]))
-    tgt = nodes_by_id.get(int(edge["target"]))
-    if not src or not tgt:
+    s = int(edge["source"])
+    t = int(edge["target"])
+    if s not in tags_lc or t not in tags_lc:
         return base
 
-    src_tags = src.get("tags") or []
-    tgt_tags = tgt.get("tags") or []
-    src_kw = src.get("keywords") or []
-    tgt_kw = tgt.get("keywords") or []
-    src_auth = split_authors(src.get("authors"))
-    tgt_auth = split_authors(tgt.get("authors"))
-
-    overlap_tag = has_overlap(src_tags, tgt_tags)
-    overlap_kw = has_overlap(src_kw, tgt_kw)
-    overlap_auth = has_overlap(src_auth, tgt_auth)
-
-    if overlap_tag and not overlap_kw and not overlap_auth:
-        return "related-tag"
-    if not overlap_tag and overlap_kw and not overlap_auth:
-        return "related-keyword"
-    if not overlap_tag and not overlap_kw and overlap_auth:
-        return "related-author"
-    if overlap_tag and overlap_kw and not overlap_auth:
-        return "related-tag-keyword"
-    if not overlap_tag and overlap_kw and overlap_auth:
-        return "related-keyword-author"
-    if overlap_tag and overlap_kw and overlap_auth:
-        return "related-tag-keyword-author"
-    if overlap_tag and not overlap_kw and overlap_auth:
-        return "related-tag-author"
-
-    return base
+    mask = (
+        (not tags_lc[s].isdisjoint(tags_lc[t])) << 2
+        | (not kw_lc[s].isdisjoint(kw_lc[t])) << 1
+        | (not auth_lc[s].isdisjoint(auth_lc[t]))
+    )
+    return EDGE_TYPE_BY_MASK[mask] or base
 
 
 def annotate_edges(data: Dict[str, List[Dict[str, object]]]) -> None:
     nodes_by_id = {int(n["id"]): n for n in data.get("nodes", [])}
+    # Lowercase each node's tokens once instead of once per incident edge.
+    tags_lc = {nid: lower_set(n.get("tags")) for nid, n in nodes_by_id.items()}
+    kw_lc = {nid: lower_set(n.get("keywords")) for nid, n in nodes_by_id.items()}
+    auth_lc = {nid: lower_set(split_authors(n.get("authors"))) for nid, n in nodes_by_id.items()}
     for edge in data.get("links", []):
-        edge["resolved_type"] = resolve_edge_type(edge, nodes_by_id)
+        edge["resolved_type"] = resolve_edge_type(edge, tags_lc, kw_lc, auth_lc)
 
 
 def write_json_graph(data: Dict[str, List[Dict[str, object]]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        json.dump(data, f, indent=2)
+
+
+DOT_ESCAPES = str.maketrans({"\\": "\\\\", "\"": "\\\""})
 
 
 def escape_label(value: str) -> str:
-    return value.replace("\\", "\\\\").replace("\"", "\\\"")
+    return value.translate(DOT_ESCAPES)
 
 
-def to_dot(data: Dict[str, List[Dict[str, object]]]) -> str:
-    lines = ["digraph Papers {", "  rankdir=LR;", "  node [shape=box, style=rounded];"]
+def iter_dot(data: Dict[str, List[Dict[str, object]]]) -> Iterator[str]:
+    yield "digraph Papers {"
+    yield "  rankdir=LR;"
+    yield "  node [shape=box, style=rounded];"
     for node in data.get("nodes", []):
         details = []
         if node.get("paper_id"):
@@ -683,36 +1017,39 @@ def to_dot(data: Dict[str, List[Dict[str, object]]]) -> str:
             label_lines.append(escape_label(f"keywords: {kws}"))
 
         label = "\\n".join(label_lines)
-        lines.append(f'  "{node["id"]}" [label="{label}"];')
+        yield f'  "{node["id"]}" [label="{label}"];'
 
     for edge in data.get("links", []):
         label = escape_label(str(edge.get("resolved_type", edge.get("type", "related"))))
-        lines.append(f'  "{edge["source"]}" -> "{edge["target"]}" [label="{label}"];')
+        yield f'  "{edge["source"]}" -> "{edge["target"]}" [label="{label}"];'
 
-    lines.append("}")
-    return "\n".join(lines)
+    yield "}"
+
+
+def to_dot(data: Dict[str, List[Dict[str, object]]]) -> str:
+    return "\n".join(iter_dot(data))
 
 
 def write_dot_graph(data: Dict[str, List[Dict[str, object]]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(to_dot(data), encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(line + "\n" for line in iter_dot(data))
 
 
-def cmd_export(args: argparse.Namespace) -> None:
-    db_path = Path(args.db)
-    conn = connect(db_path)
-    init_db(conn)
-    data = rows_to_graph(conn, project_id=args.project_id)
+def export_project(
+    conn: sqlite3.Connection,
+    project_id: str | None = None,
+    json_path: Path = DEFAULT_GRAPH_DIR / "graph.json",
+    dot_path: Path | None = DEFAULT_GRAPH_DIR / "graph.dot",
+) -> None:
+    """Write graph exports for one project (or everything) over an already-open connection."""
+    if project_id and json_path.name == "graph.json":
+        json_path = json_path.with_name(f"{project_id}.json")
+    if project_id and dot_path and dot_path.name == "graph.dot":
+        dot_path = dot_path.with_name(f"{project_id}.dot")
+
+    data = rows_to_graph(conn, project_id=project_id)
     annotate_edges(data)
-
-    json_path = Path(args.json_out)
-    dot_path = Path(args.dot_out) if args.dot_out else None
-
-    if args.project_id and json_path.name == "graph.json":
-        json_path = json_path.with_name(f"{args.project_id}.json")
-    if args.project_id and dot_path and dot_path.name == "graph.dot":
-        dot_path = dot_path.with_name(f"{args.project_id}.dot")
-
     write_json_graph(data, json_path)
     print(f"Wrote graph JSON to {json_path}")
     if dot_path:
@@ -720,6 +1057,12 @@ def cmd_export(args: argparse.Namespace) -> None:
         print(f"Wrote Graphviz DOT to {dot_path}")
 
 
+def cmd_export(args: argparse.Namespace) -> None:
+    conn = open_db(args)
+    dot_path = Path(args.dot_out) if args.dot_out else None
+    export_project(conn, args.project_id, Path(args.json_out), dot_path)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Track research papers in SQLite and export graphs.",
@@ -793,7 +1136,7 @@ def build_parser() -> argparse.ArgumentParser:
     add_p.set_defaults(func=cmd_add)
 
     import_p = subparsers.add_parser("import-pdf", help="Extract metadata and add from a PDF")
-    import_p.add_argument("--path", required=True, help="Path to PDF file")
+    import_p.add_argument("--path", required=True, nargs="+", help="Path(s) to PDF file(s); several are extracted in parallel")
     import_p.add_argument("--paper-id", dest="paper_id", help="Custom paper identifier")
     import_p.add_argument("--project-id", dest="project_id", help="Project UUID to link")
     import_p.add_argument("--title", help="Paper title override")
@@ -857,9 +1200,13 @@ def build_parser() -> argparse.ArgumentParser:
     import_p.set_defaults(func=cmd_import_pdf)
 
     list_p = subparsers.add_parser("list", help="List stored papers")
-    list_p.add_argument("--search", help="Substring search over title/authors")
-    list_p.add_argument("--tag", help="Filter by tag substring")
-    list_p.add_argument("--keyword", help="Filter by keyword substring")
+    list_p.add_argument(
+        "--search",
+        help="Search title/authors for words starting with each term (e.g. 'learn' matches 'learning' "
+        "but 'earning' does not; without FTS5, a plain substring match)",
+    )
+    list_p.add_argument("--tag", help="Filter by tag (exact, case-insensitive)")
+    list_p.add_argument("--keyword", help="Filter by keyword (exact, case-insensitive)")
     list_p.add_argument("--limit", type=int, help="Limit number of rows")
     list_p.set_defaults(func=cmd_list)
 
@@ -874,6 +1221,12 @@ def build_parser() -> argparse.ArgumentParser:
     link_p.add_argument("--note", help="Optional note about the link")
     link_p.set_defaults(func=cmd_link)
 
+    delete_p = subparsers.add_parser(
+        "delete-project", help="Delete a project and its papers, links and assessments in-process"
+    )
+    delete_p.add_argument("--project-id", dest="project_id", required=True, help="Project UUID to delete")
+    delete_p.set_defaults(func=cmd_delete_project)
+
     export_p = subparsers.add_parser("export", help="Export graph data")
     export_p.add_argument(
         "--project-id",
@@ -1,31 +1,29 @@
-import sqlite3
-import os
+from pathlib import Path
+from typing import Iterable, Tuple
 
-db_path = "library/db/papers.db"
+from paper_db import DEFAULT_DB, connect, init_db, transaction
 
-# Ensure directory exists
-os.makedirs(os.path.dirname(db_path), exist_ok=True)
+# (subject, body, status) rows to seed
+SEED_MESSAGES = [
+    ("Welcome", "This is a test message in your new Inbox.", "unread"),
+]
 
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
 
-# Create table if not exists (it should exist from paper_db.py but just in case)
-cursor.execute("""
-    CREATE TABLE IF NOT EXISTS inbox (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        subject TEXT,
-        body TEXT,
-        status TEXT,
-        created_at TEXT DEFAULT (datetime('now'))
-    );
-""")
+def populate_inbox(db_path: Path, rows: Iterable[Tuple[str, str, str]]) -> int:
+    # connect() applies the WAL/synchronous pragmas and init_db() owns the inbox schema
+    conn = connect(db_path)
+    init_db(conn)
+    try:
+        with transaction(conn):
+            cur = conn.executemany(
+                "INSERT INTO inbox (subject, body, status) VALUES (?, ?, ?)",
+                rows,
+            )
+    finally:
+        conn.close()
+    return cur.rowcount
 
-# Insert specific test message
-cursor.execute("""
-    INSERT INTO inbox (subject, body, status) 
-    VALUES ('Welcome', 'This is a test message in your new Inbox.', 'unread')
-""")
 
-conn.commit()
-print("Test message added to inbox.")
-conn.close()
+if __name__ == "__main__":
+    count = populate_inbox(DEFAULT_DB, SEED_MESSAGES)
+    print(f"{count} test message(s) added to inbox.")
@@ -4,42 +4,40 @@ from __future__ import annotations
 import argparse
 import sqlite3
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Set
+from typing import List
 
-PAPER_DB = Path(__file__).resolve().parent.parent / "paper_db.py"
+PAPER_DB = Path(__file__).parent.parent / "paper_db.py"
+sys.path.insert(0, str(PAPER_DB.parent))
+
+from paper_db import split_authors, split_csv  # noqa: E402
 
 
 def connect(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")  # temp token indexes stay off disk
+    conn.execute("PRAGMA cache_size=-65536;")  # ~64 MiB
     return conn
 
 
-def normalize_tags(raw: str | None) -> List[str]:
-    if not raw:
-        return []
-    parts = [p.strip() for p in raw.split(",")]
-    return [p for p in parts if p]
-
-
-def split_authors(authors: str | None) -> List[str]:
-    if not authors:
-        return []
-    cleaned = authors.replace(" and ", ",")
-    return [part.strip() for part in cleaned.split(",") if part.strip()]
-
-
-def has_overlap(a: List[str], b: List[str]) -> bool:
-    set_a = {x.lower() for x in a}
-    set_b = {x.lower() for x in b}
-    return bool(set_a & set_b)
+# Bit per matching strategy; LABEL_FLAGS fixes the order the link type names them in.
+STRATEGY_FLAGS = {"tags": 1, "keywords": 2, "authors": 4, "year": 8}
+LABEL_FLAGS = (("tag", 1), ("keyword", 2), ("author", 4), ("year", 8))
 
 
 def auto_build_links(db_path: Path, project_id: str | None, strategies: List[str], delete_existing: bool = False) -> None:
     conn = connect(db_path)
-    
+    # Keep the transaction's dirty pages in the page cache until COMMIT instead of spilling them mid-run.
+    conn.execute("PRAGMA cache_spill=0")
+    # One write transaction for the delete and every insert: a single commit, and an
+    # interrupted run never leaves the project with old links deleted but none rebuilt.
+    conn.execute("BEGIN IMMEDIATE")
+
     if delete_existing:
         print(f"Deleting existing relationships for project {project_id if project_id else 'ALL'}...")
         if project_id:
@@ -57,18 +55,23 @@ def auto_build_links(db_path: Path, project_id: str | None, strategies: List[str
             # However, checking auto_build_links logic, it only creates links between papers IN the project list.
             # So we should probably only delete links between papers IN the project.
             
-            conn.execute("""
+            # Materialize the project's ids once (keyed, so both IN probes are index lookups)
+            # instead of evaluating the papers subquery for each side.
+            conn.execute("CREATE TEMP TABLE project_ids (id INTEGER PRIMARY KEY)")
+            conn.execute("INSERT INTO project_ids SELECT id FROM papers WHERE project_id = ?", (project_id,))
+            cur = conn.execute("""
                 DELETE FROM relationships 
-                WHERE source_id IN (SELECT id FROM papers WHERE project_id = ?)
-                   AND target_id IN (SELECT id FROM papers WHERE project_id = ?)
-            """, (project_id, project_id))
+                WHERE source_id IN project_ids
+                   AND target_id IN project_ids
+            """)
+            conn.execute("DROP TABLE project_ids")
         else:
             # No project ID means we operate on ALL papers (based on current script logic),
             # so we wipe the table? Or just don't support delete without project?
             # The script allows project_id=None to process all.
-            conn.execute("DELETE FROM relationships")
+            cur = conn.execute("DELETE FROM relationships")
         
-        print(f"Deleted relationships. Rows affected: {conn.total_changes}")
+        print(f"Deleted relationships. Rows affected: {cur.rowcount}")
 
     # Get all papers for the project
     query = """
@@ -78,63 +81,80 @@ def auto_build_links(db_path: Path, project_id: str | None, strategies: List[str
         ORDER BY id
     """
     papers = conn.execute(query, {"project_id": project_id}).fetchall()
-    
-    links_created = 0
-    links_skipped = 0
-    
-    # Check each pair of papers
-    for i, paper_a in enumerate(papers):
-        for paper_b in papers[i + 1:]:
-            id_a = paper_a["id"]
-            id_b = paper_b["id"]
-            
-            matches = []
-
-            # Check Tags
-            if "tags" in strategies:
-                tags_a = normalize_tags(paper_a["tags"])
-                tags_b = normalize_tags(paper_b["tags"])
-                if has_overlap(tags_a, tags_b):
-                    matches.append("tag")
-            
-            # Check Keywords
-            if "keywords" in strategies:
-                keywords_a = normalize_tags(paper_a["keywords"])
-                keywords_b = normalize_tags(paper_b["keywords"])
-                if has_overlap(keywords_a, keywords_b):
-                    matches.append("keyword")
-            
-            # Check Authors
-            if "authors" in strategies:
-                authors_a = split_authors(paper_a["authors"])
-                authors_b = split_authors(paper_b["authors"])
-                if has_overlap(authors_a, authors_b):
-                    matches.append("author")
-
-            # Check Year
-            if "year" in strategies:
-                # Only link if both have years and they are the same
-                if paper_a["year"] and paper_b["year"] and paper_a["year"] == paper_b["year"]:
-                    matches.append("year")
-
-            if matches:
-                link_type = "related-" + "-".join(matches)
-                # Try to create bidirectional links
-                for source, target in [(id_a, id_b), (id_b, id_a)]:
-                    cur = conn.cursor()
-                    cur.execute(
-                        """
-                        INSERT OR IGNORE INTO relationships (source_id, target_id, relation_type)
-                        VALUES (?, ?, ?)
-                        """,
-                        (source, target, link_type),
-                    )
-                    if cur.rowcount > 0:
-                        links_created += 1
-                    else:
-                        links_skipped += 1
-    
+
+    # Parse every paper once into inverted indexes (token -> paper ids); only tokens shared
+    # by two or more papers can produce a pair, so singleton buckets never reach SQLite,
+    # which self-joins the rest instead of intersecting token sets per pair in Python.
+    parsers = {
+        "tags": lambda paper: split_csv(paper["tags"]),
+        "keywords": lambda paper: split_csv(paper["keywords"]),
+        "authors": lambda paper: split_authors(paper["authors"]),
+        # Only link if both have years and they are the same
+        "year": lambda paper: [paper["year"]] if paper["year"] else [],
+    }
+    buckets = {strategy: defaultdict(list) for strategy in STRATEGY_FLAGS if strategy in strategies}
+    for paper in papers:
+        pid = paper["id"]
+        for strategy, index in buckets.items():
+            for token in frozenset(str(v).lower() for v in parsers[strategy](paper)):
+                index[token].append(pid)
+
+    # One token table across all strategies: the self-join on (flag, token) is the
+    # sparse co-occurrence product (papers x tokens) @ (tokens x papers), and the
+    # per-pair flag sum spells out the categories in a fixed order.
+    conn.execute(
+        "CREATE TEMP TABLE token_idx (flag INTEGER, token, pid INTEGER, PRIMARY KEY (flag, token, pid)) WITHOUT ROWID"
+    )
+    conn.executemany(
+        "INSERT INTO token_idx (flag, token, pid) VALUES (?, ?, ?)",
+        # Generator, not a list: rows are bound one by one without materializing them all.
+        (
+            (STRATEGY_FLAGS[strategy], token, pid)
+            for strategy, index in buckets.items()
+            for token, pids in index.items()
+            if len(pids) > 1
+            for pid in pids
+        ),
+    )
+    # Fresh stats so the self-join plans around skewed tokens (a few very common tags).
+    conn.execute("ANALYZE temp.token_idx")
+    link_type = "'related'" + "".join(
+        f" || CASE WHEN m & {flag} THEN '-{label}' ELSE '' END" for label, flag in LABEL_FLAGS
+    )
+    conn.execute(
+        f"""
+        CREATE TEMP TABLE candidate_links AS
+        SELECT a AS source_id, b AS target_id, {link_type} AS relation_type
+        FROM (
+            SELECT x.pid AS a, y.pid AS b, SUM(DISTINCT x.flag) AS m
+            FROM token_idx x
+            JOIN token_idx y ON y.flag = x.flag AND y.token = x.token AND x.pid < y.pid
+            GROUP BY x.pid, y.pid
+        )
+        """
+    )
+
+    # Store each undirected link once as (min_id, max_id); readers expand both
+    # directions through the relationships_bidir view.
+    candidates = conn.execute("SELECT count(*) FROM candidate_links").fetchone()[0]
+    before = conn.total_changes
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO relationships (source_id, target_id, relation_type)
+        SELECT source_id, target_id, relation_type FROM candidate_links c
+        WHERE NOT EXISTS (
+            SELECT 1 FROM relationships r
+            WHERE r.source_id = c.target_id AND r.target_id = c.source_id AND r.relation_type = c.relation_type
+        )
+        ORDER BY 1, 2
+        """
+    )
+    links_created = conn.total_changes - before
+    links_skipped = candidates - links_created
+
     conn.commit()
+    # Refresh planner stats on papers/relationships if this run changed them enough to matter.
+    conn.execute("PRAGMA optimize")
     conn.close()
     
     print(f"Auto-discovery complete with strategies {strategies}: {links_created} links created, {links_skipped} already existed")
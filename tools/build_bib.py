@@ -7,8 +7,13 @@ import sys
 from pathlib import Path
 from typing import Iterable, Optional
 
-DEFAULT_DB = Path(__file__).resolve().parent.parent / "library" / "db" / "papers.db"
-DEFAULT_BIB_DIR = Path(__file__).resolve().parent.parent / "library" / "bibtex"
+PAPER_DB = Path(__file__).parent.parent / "paper_db.py"
+sys.path.insert(0, str(PAPER_DB.parent))
+
+import paper_db  # noqa: E402
+
+DEFAULT_DB = paper_db.DEFAULT_DB
+DEFAULT_BIB_DIR = Path(__file__).parent.parent / "library" / "bibtex"
 
 
 def resolve_output_path(conn: sqlite3.Connection, project_id: Optional[str], out_path: Optional[Path]) -> Path:
@@ -28,20 +33,25 @@ def export_bib(conn: sqlite3.Connection, project_id: Optional[str], out_path: Op
     target = resolve_output_path(conn, project_id, out_path)
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    params = {}
-    where = ""
+    # Both shapes are covered by the partial idx_papers_project_bibtex, so NULL-bibtex rows are never visited.
     if project_id:
-        where = " WHERE project_id = :pid"
-        params["pid"] = project_id
-    rows = conn.execute(
-        f"SELECT bibtex FROM papers{where} AND bibtex IS NOT NULL" if where else "SELECT bibtex FROM papers WHERE bibtex IS NOT NULL",
-        params,
-    ).fetchall()
-
-    entries = [r[0] for r in rows if r[0]]
-    content = "\n\n".join(entries) + ("\n" if entries else "")
-    target.write_text(content, encoding="utf-8")
-    print(f"Wrote {len(entries)} BibTeX entries to {target}")
+        sql = "SELECT bibtex FROM papers WHERE project_id = :pid AND bibtex IS NOT NULL"
+    else:
+        sql = "SELECT bibtex FROM papers WHERE bibtex IS NOT NULL"
+    params = {"pid": project_id}
+    count = 0
+    # Stream entries straight to disk so peak memory stays at one row, not the whole library.
+    with open(target, "w", encoding="utf-8", buffering=1 << 20) as fp:
+        for (bib,) in conn.execute(sql, params):
+            if not bib:
+                continue
+            if count:
+                fp.write("\n\n")
+            fp.write(bib)
+            count += 1
+        if count:
+            fp.write("\n")
+    print(f"Wrote {count} BibTeX entries to {target}")
     return target
 
 
@@ -66,8 +76,10 @@ def main(argv: Iterable[str] | None = None) -> None:
     if args.out and len(projects) != 1:
         raise SystemExit("--out can only be used with a single project or no project")
 
-    conn = sqlite3.connect(args.db)
-    conn.row_factory = sqlite3.Row
+    # paper_db owns the schema; init_db() adds idx_papers_project_bibtex to older databases.
+    conn = paper_db.connect(Path(args.db))
+    paper_db.init_db(conn)
+    conn.execute("PRAGMA mmap_size=268435456")
 
     out_path = Path(args.out) if args.out else None
     for proj in projects:
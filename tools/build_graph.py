@@ -2,19 +2,19 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import sqlite3
 import sys
 from pathlib import Path
 from typing import Iterable
 
-PAPER_DB = Path(__file__).resolve().parent.parent / "paper_db.py"
+PAPER_DB = Path(__file__).parent.parent / "paper_db.py"
+sys.path.insert(0, str(PAPER_DB.parent))
 
+import paper_db  # noqa: E402
 
-def build_for_project(project_id: str | None) -> None:
-    cmd = [sys.executable, str(PAPER_DB), "export"]
-    if project_id:
-        cmd.extend(["--project-id", project_id])
-    subprocess.run(cmd, check=True)
+
+def build_for_project(conn: sqlite3.Connection, project_id: str | None) -> None:
+    paper_db.export_project(conn, project_id)
 
 
 def main(argv: Iterable[str] | None = None) -> None:
@@ -30,8 +30,14 @@ def main(argv: Iterable[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     projects = args.project_id or [None]
-    for proj in projects:
-        build_for_project(proj)
+    # One connection for every project instead of a fresh interpreter per export.
+    conn = paper_db.connect(paper_db.DEFAULT_DB)
+    try:
+        paper_db.init_db(conn)
+        for proj in projects:
+            build_for_project(conn, proj)
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
@@ -6,15 +6,24 @@ import subprocess
 import sys
 from pathlib import Path
 
-PAPER_DB = Path(__file__).resolve().parent.parent / "paper_db.py"
+PAPER_DB = Path(__file__).parent.parent / "paper_db.py"
+sys.path.insert(0, str(PAPER_DB.parent))
 
+import paper_db  # noqa: E402
 
-def build_link(source: str, target: str, relation_type: str, note: str | None, db: str | None) -> None:
-    cmd = [sys.executable, str(PAPER_DB), "link", "--source", source, "--target", target, "--type", relation_type]
-    if note:
-        cmd.extend(["--note", note])
+
+def build_link(
+    source: str, target: str, relation_type: str, note: str | None, db: str | None, subprocess_cli: bool = False
+) -> None:
+    if not subprocess_cli:
+        paper_db.link(source, target, relation_type, note=note, db=db)
+        return
+    cmd = [sys.executable, str(PAPER_DB)]
     if db:
         cmd.extend(["--db", db])
+    cmd.extend(["link", "--source", source, "--target", target, "--type", relation_type])
+    if note:
+        cmd.extend(["--note", note])
     subprocess.run(cmd, check=True)
 
 
@@ -32,9 +41,14 @@ def main() -> None:
     )
     parser.add_argument("--note", help="Optional note for the relationship")
     parser.add_argument("--db", help="Path to SQLite database (defaults to paper_db.py default)")
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run paper_db.py link in a child interpreter instead of calling it in-process",
+    )
     args = parser.parse_args()
 
-    build_link(args.source, args.target, args.type, args.note, args.db)
+    build_link(args.source, args.target, args.type, args.note, args.db, subprocess_cli=args.subprocess)
 
 
 if __name__ == "__main__":
@@ -3,32 +3,36 @@ from __future__ import annotations
 
 import argparse
 import sqlite3
+import sys
 from pathlib import Path
 from typing import Iterable
 
-DEFAULT_DB = Path(__file__).resolve().parent.parent / "library" / "db" / "papers.db"
+DEFAULT_DB = Path(__file__).parent.parent / "library" / "db" / "papers.db"
 
 
 def list_projects(db_path: Path) -> None:
     conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA query_only=1")
     conn.row_factory = sqlite3.Row
     cur = conn.execute(
         "SELECT id, name, description, bib_text_path, created_at FROM projects ORDER BY created_at"
     )
-    rows = cur.fetchall()
-    if not rows:
-        print("No projects found.")
-        return
-    for row in rows:
+    lines = []
+    for row in cur:
         line = f"{row['id']}"
         if row["name"]:
             line += f" | {row['name']}"
-        print(line)
+        lines.append(line)
         if row["description"]:
-            print(f"  desc: {row['description']}")
+            lines.append(f"  desc: {row['description']}")
         if row["bib_text_path"]:
-            print(f"  bib: {row['bib_text_path']}")
-        print(f"  created: {row['created_at']}")
+            lines.append(f"  bib: {row['bib_text_path']}")
+        lines.append(f"  created: {row['created_at']}")
+    if not lines:
+        print("No projects found.")
+        return
+    # One write for the whole listing instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: Iterable[str] | None = None) -> None:
@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
-PAPER_DB = Path(__file__).resolve().parent.parent / "paper_db.py"
+PAPER_DB = Path(__file__).parent.parent / "paper_db.py"
+sys.path.insert(0, str(PAPER_DB.parent))
+
+import paper_db  # noqa: E402
 
 
 def build_project_graph(project_id: str) -> None:
-    cmd = [sys.executable, str(PAPER_DB), "export", "--project-id", project_id]
-    subprocess.run(cmd, check=True)
+    conn = paper_db.connect(paper_db.DEFAULT_DB)
+    try:
+        paper_db.init_db(conn)
+        paper_db.export_project(conn, project_id)
+    finally:
+        conn.close()
 
 
 def main() -> None:
@@ -3,10 +3,12 @@ from __future__ import annotations
 import argparse
 import json
 import sqlite3
+import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable, Optional
 
-DEFAULT_DB = Path(__file__).resolve().parent.parent / "library" / "db" / "papers.db"
+DEFAULT_DB = Path(__file__).parent.parent / "library" / "db" / "papers.db"
 
 
 def resolve_project_id(conn: sqlite3.Connection, project_id: Optional[str], project_name: Optional[str]) -> Optional[str]:
@@ -38,14 +40,28 @@ def fetch_papers(conn: sqlite3.Connection, project_id: Optional[str]):
         FROM papers{where}
         ORDER BY id
     """
-    return conn.execute(sql, params).fetchall()
+    # Plain tuple rows streamed from the cursor: callers zip them against the column names read once.
+    cur = conn.execute(sql, params)
+    cols = [d[0] for d in cur.description]
+    return cur, cols
 
 
-def format_row(row: sqlite3.Row) -> dict:
-    return {k: row[k] for k in row.keys()}
+def format_row(cols: list[str], row: tuple) -> dict:
+    return dict(zip(cols, row))
 
 
-def print_table(rows: list[sqlite3.Row]) -> None:
+def print_json(rows: Iterable[tuple], cols: list[str]) -> None:
+    # Same bytes as json.dumps(list, indent=2), written one object at a time.
+    out = sys.stdout
+    sep = "[\n  "
+    for r in rows:
+        out.write(sep)
+        out.write(json.dumps(format_row(cols, r), indent=2).replace("\n", "\n  "))
+        sep = ",\n  "
+    out.write("[]\n" if sep.startswith("[") else "\n]\n")
+
+
+def print_table(rows: Iterable[tuple], cols: list[str]) -> None:
     headers = [
         "id",
         "project_id",
@@ -63,24 +79,8 @@ def print_table(rows: list[sqlite3.Row]) -> None:
         "sought_not_revrieved",
     ]
     print("\t".join(headers))
-    for r in rows:
-        values = [
-            r["id"],
-            r["project_id"],
-            r["title"],
-            r["doi"],
-            r["paper_id"],
-            r["database"],
-            r["is_duplicated"],
-            r["duplicate_reason"],
-            r["is_excluded"],
-            r["excluded_reason"],
-            r["is_included"],
-            r["included_reason"],
-            r["revrieved_sought"],
-            r["sought_not_revrieved"],
-        ]
-        print("\t".join("" if v is None else str(v) for v in values))
+    pick = itemgetter(*(cols.index(h) for h in headers))
+    sys.stdout.writelines("\t".join("" if v is None else str(v) for v in pick(r)) + "\n" for r in rows)
 
 
 def main(argv: Iterable[str] | None = None) -> None:
@@ -95,15 +95,14 @@ def main(argv: Iterable[str] | None = None) -> None:
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     conn = sqlite3.connect(args.db)
-    conn.row_factory = sqlite3.Row
 
     project_id = resolve_project_id(conn, args.project_id, args.project_name)
-    rows = fetch_papers(conn, project_id)
+    rows, cols = fetch_papers(conn, project_id)
 
     if args.json:
-        print(json.dumps([format_row(r) for r in rows], indent=2))
+        print_json(rows, cols)
     else:
-        print_table(rows)
+        print_table(rows, cols)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,14 @@ from __future__ import annotations
 
 import argparse
 import os
+import select
 import signal
 import subprocess
 import time
 from pathlib import Path
 from typing import Iterable
 
-UI_DIR = Path(__file__).resolve().parent.parent / "ui"
+UI_DIR = Path(__file__).parent.parent / "ui"
 DEFAULT_PID_FILE = UI_DIR / ".ui-dev.pid"
 DEFAULT_LOG_FILE = Path("/tmp/ui-dev.log")
 
@@ -34,6 +35,36 @@ def is_pid_alive(pid: int) -> bool:
     return True
 
 
+def wait_for_exit(pid: int, timeout: float) -> bool:
+    """Return True once pid has exited, False if it is still alive after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(pid)
+        except OSError:
+            pidfd = None
+        if pidfd is not None:
+            # Linux: the pidfd becomes readable the moment the process exits, even before
+            # whoever inherited it gets round to reaping the zombie.
+            try:
+                ready, _, _ = select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            return bool(ready)
+
+    # Elsewhere poll with backoff, so quick exits are seen within milliseconds.
+    delay = 0.005
+    while True:
+        if not is_pid_alive(pid):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+
+
 def read_pid(pid_file: Path) -> int | None:
     if not pid_file.exists():
         return None
@@ -63,13 +94,10 @@ def stop_dev(pid_file: Path, timeout: float = 10.0) -> None:
         remove_pid_file(pid_file)
         raise SystemExit("Removed stale PID file; no running UI dev server found.")
 
-    start = time.monotonic()
-    while time.monotonic() - start < timeout:
-        if not is_pid_alive(pid):
-            remove_pid_file(pid_file)
-            print("Stopped UI dev server.")
-            return
-        time.sleep(0.2)
+    if wait_for_exit(pid, timeout):
+        remove_pid_file(pid_file)
+        print("Stopped UI dev server.")
+        return
 
     try:
         os.kill(pid, signal.SIGKILL)
@@ -78,12 +106,10 @@ def stop_dev(pid_file: Path, timeout: float = 10.0) -> None:
         print("Stopped UI dev server.")
         return
 
-    for _ in range(10):
-        if not is_pid_alive(pid):
-            remove_pid_file(pid_file)
-            print("Stopped UI dev server.")
-            return
-        time.sleep(0.2)
+    if wait_for_exit(pid, 2.0):
+        remove_pid_file(pid_file)
+        print("Stopped UI dev server.")
+        return
 
     raise SystemExit("Failed to stop UI dev server; process still running.")
 
@@ -3,6 +3,17 @@ import react from '@vitejs/plugin-react'
 import path from 'path'
 import fs from 'fs'
 
+// Under WAL recent commits may still live in papers.db-wal; fold them into the main file
+// before it is copied or streamed as a single file.
+function checkpointDb(dbPath: string) {
+  const db = new Database(dbPath)
+  try {
+    db.pragma('wal_checkpoint(PASSIVE)')
+  } finally {
+    db.close()
+  }
+}
+
 function serveLibraryDb(): Plugin {
   const sourcePath = path.resolve(__dirname, '../library/db/papers.db')
   const publicName = 'papers.db'
@@ -12,6 +23,7 @@ function serveLibraryDb(): Plugin {
     configureServer(server) {
       server.middlewares.use(`/${publicName}`, (_req: any, res: any, next: any) => {
         if (!fs.existsSync(sourcePath)) return next()
+        checkpointDb(sourcePath)
         res.setHeader('Content-Type', 'application/octet-stream')
         fs.createReadStream(sourcePath).pipe(res)
       })
@@ -21,6 +33,7 @@ function serveLibraryDb(): Plugin {
         this.warn(`papers.db not found at ${sourcePath}; skipping bundle copy.`)
         return
       }
+      checkpointDb(sourcePath)
       const buffer = fs.readFileSync(sourcePath)
       this.emitFile({ type: 'asset', fileName: publicName, source: buffer })
     },
@@ -63,6 +76,16 @@ function serveLibraryGraph(): Plugin {
 import Database from 'better-sqlite3'
 import { exec } from 'child_process'
 
+// Match paper_db.connect(): WAL lets these handlers read while the Python tools write,
+// and synchronous=NORMAL is durable under WAL without an fsync on every commit.
+function openDb(dbPath: string) {
+  const db = new Database(dbPath)
+  db.pragma('journal_mode = WAL')
+  db.pragma('synchronous = NORMAL')
+  db.pragma('temp_store = MEMORY')
+  return db
+}
+
 function serveProjectsApi(): Plugin {
   const dbPath = path.resolve(__dirname, '../library/db/papers.db')
   const buildScript = path.resolve(__dirname, '../tools/build_graph.py')
@@ -79,7 +102,7 @@ function serveProjectsApi(): Plugin {
         }
 
         try {
-          const db = new Database(dbPath)
+          const db = openDb(dbPath)
 
           // GET /api/projects/bibtex?projectId=...
           if (req.method === 'GET' && req.url.startsWith('/bibtex')) {
@@ -240,22 +263,25 @@ function serveProjectsApi(): Plugin {
              }
 
              // Cascading delete: Risk Assessments -> Relationships -> Papers -> Project
-             try {
-                // Delete risk assessments for papers in this project
-                db.prepare('DELETE FROM risk_assessments WHERE paper_id IN (SELECT id FROM papers WHERE project_id = ?)').run(id)
-                
-                // Delete relationships where source or target is a paper in this project
-                db.prepare('DELETE FROM relationships WHERE source_id IN (SELECT id FROM papers WHERE project_id = ?) OR target_id IN (SELECT id FROM papers WHERE project_id = ?)').run(id, id)
-                
-                // Delete papers in this project
-                db.prepare('DELETE FROM papers WHERE project_id = ?').run(id)
-             } catch (err: any) {
-                console.error(`Error performing cascading delete: ${err.message}`)
-                // We continue to delete the project even if cascading fails (though it shouldn't)
-             }
+             // One transaction for all four statements: a single commit/fsync instead of one per DELETE.
+             const deleteProject = db.transaction((projectId: string) => {
+               try {
+                  // Delete risk assessments for papers in this project
+                  db.prepare('DELETE FROM risk_assessments WHERE paper_id IN (SELECT id FROM papers WHERE project_id = ?)').run(projectId)
+                  
+                  // Delete relationships where source or target is a paper in this project
+                  db.prepare('DELETE FROM relationships WHERE source_id IN (SELECT id FROM papers WHERE project_id = ?) OR target_id IN (SELECT id FROM papers WHERE project_id = ?)').run(projectId, projectId)
+                  
+                  // Delete papers in this project
+                  db.prepare('DELETE FROM papers WHERE project_id = ?').run(projectId)
+               } catch (err: any) {
+                  console.error(`Error performing cascading delete: ${err.message}`)
+                  // We continue to delete the project even if cascading fails (though it shouldn't)
+               }
 
-             const stmt = db.prepare('DELETE FROM projects WHERE id = ?')
-             stmt.run(id)
+               db.prepare('DELETE FROM projects WHERE id = ?').run(projectId)
+             })
+             deleteProject(id)
 
              // Delete graph files
              try {
@@ -502,7 +528,7 @@ const serveNotesApi = (): Plugin => {
         }
 
         try {
-          const db = new Database(dbPath)
+          const db = openDb(dbPath)
 
           // GET /api/notes?paperId=...
           if (req.method === 'GET') {
@@ -636,7 +662,7 @@ function servePapersApi(): Plugin {
         }
 
         try {
-          const db = new Database(dbPath)
+          const db = openDb(dbPath)
 
           // GET /api/papers?projectId=...
           if (req.method === 'GET') {
@@ -881,7 +907,7 @@ function serveInboxApi(): Plugin {
         }
 
         try {
-          const db = new Database(dbPath)
+          const db = openDb(dbPath)
 
           // GET /api/inbox
           // Since we mounted at /api/inbox, req.url will be relative to that, i.e., '/'